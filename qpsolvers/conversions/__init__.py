@@ -20,6 +20,7 @@
 
 """Convert problems from and to standard QP form."""
 
+from .ensure_float64 import ensure_float64
 from .ensure_sparse_matrices import ensure_sparse_matrices
 from .linear_from_box_inequalities import linear_from_box_inequalities
 from .socp_from_qp import socp_from_qp
@@ -29,5 +30,6 @@ __all__ = [
     "linear_from_box_inequalities",
     "socp_from_qp",
     "split_dual_linear_box",
+    "ensure_float64",
     "ensure_sparse_matrices",
 ]
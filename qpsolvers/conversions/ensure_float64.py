@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2016-2022 Stéphane Caron and the qpsolvers contributors.
+#
+# This file is part of qpsolvers.
+#
+# qpsolvers is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# qpsolvers is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with qpsolvers. If not, see <http://www.gnu.org/licenses/>.
+
+"""Make sure problem data is in double precision."""
+
+import warnings
+from typing import Optional, Tuple, TypeVar, Union
+
+import numpy as np
+import scipy.sparse as spa
+
+ArrayType = TypeVar("ArrayType", np.ndarray, spa.csc_matrix)
+
+
+def __warn_about_dtype_conversion(name: str, dtype: np.dtype) -> None:
+    """Warn about conversion of problem data to double precision.
+
+    Parameters
+    ----------
+    name :
+        Name of the matrix or vector being converted.
+    dtype :
+        Original dtype of the matrix or vector.
+    """
+    warnings.warn(
+        f"Converted {name} from {dtype} to numpy.float64\n"
+        f"For best performance, build {name} with dtype numpy.float64"
+    )
+
+
+def __to_float64(M: Optional[ArrayType], name: str) -> Optional[ArrayType]:
+    """Convert a matrix or vector to double precision if needed.
+
+    Parameters
+    ----------
+    M :
+        Dense or sparse matrix or vector, if any.
+    name :
+        Name of the matrix or vector.
+
+    Returns
+    -------
+    :
+        Same data with dtype ``numpy.float64``, and contiguous in memory if
+        it is a dense vector.
+
+    Notes
+    -----
+    Only floating-point data in lower precision, such as ``numpy.float32``,
+    triggers a warning. Other dtypes, such as integers, are converted
+    silently. Dense matrices keep their memory layout, as bindings may
+    expect either row-major or column-major storage.
+    """
+    if M is None:
+        return M
+    if M.dtype != np.float64:
+        if np.issubdtype(M.dtype, np.floating) and M.dtype.itemsize < 8:
+            __warn_about_dtype_conversion(name, M.dtype)
+        M = M.astype(np.float64)
+    if isinstance(M, np.ndarray) and M.ndim == 1:
+        M = np.ascontiguousarray(M)
+    return M
+
+
+def ensure_float64(
+    P: Union[np.ndarray, spa.csc_matrix],
+    q: np.ndarray,
+    G: Optional[Union[np.ndarray, spa.csc_matrix]],
+    h: Optional[np.ndarray],
+    A: Optional[Union[np.ndarray, spa.csc_matrix]],
+    b: Optional[np.ndarray],
+    lb: Optional[np.ndarray],
+    ub: Optional[np.ndarray],
+) -> Tuple[
+    Union[np.ndarray, spa.csc_matrix],
+    np.ndarray,
+    Optional[Union[np.ndarray, spa.csc_matrix]],
+    Optional[np.ndarray],
+    Optional[Union[np.ndarray, spa.csc_matrix]],
+    Optional[np.ndarray],
+    Optional[np.ndarray],
+    Optional[np.ndarray],
+]:
+    """Make sure problem matrices and vectors are in double precision.
+
+    Solvers work in double precision on contiguous vectors, and their
+    bindings otherwise convert or copy problem data silently on each call.
+
+    Parameters
+    ----------
+    P :
+        Cost matrix.
+    q :
+        Cost vector.
+    G :
+        Linear inequality matrix, if any.
+    h :
+        Linear inequality vector, if any.
+    A :
+        Linear equality matrix, if any.
+    b :
+        Linear equality vector, if any.
+    lb :
+        Lower bound constraint vector, if any.
+    ub :
+        Upper bound constraint vector, if any.
+
+    Returns
+    -------
+    :
+        Tuple ``(P, q, G, h, A, b, lb, ub)`` with dtype ``numpy.float64``,
+        where vectors are contiguous in memory.
+    """
+    return (
+        __to_float64(P, "P"),
+        __to_float64(q, "q"),
+        __to_float64(G, "G"),
+        __to_float64(h, "h"),
+        __to_float64(A, "A"),
+        __to_float64(b, "b"),
+        __to_float64(lb, "lb"),
+        __to_float64(ub, "ub"),
+    )
@@ -42,6 +42,22 @@ def __warn_about_sparse_conversion(matrix_name: str) -> None:
     )
 
 
+def __is_sorted_csc(M: Union[np.ndarray, spa.csc_matrix]) -> bool:
+    """Check whether a matrix is in CSC format with sorted indices.
+
+    Parameters
+    ----------
+    M :
+        Problem matrix.
+
+    Returns
+    -------
+    :
+        True if the matrix is a CSC matrix with sorted indices.
+    """
+    return isinstance(M, spa.csc_matrix) and M.has_sorted_indices
+
+
 def ensure_sparse_matrices(
     P: Union[np.ndarray, spa.csc_matrix],
     G: Optional[Union[np.ndarray, spa.csc_matrix]],
@@ -63,7 +79,19 @@ def ensure_sparse_matrices(
     -------
     :
         Tuple of all three matrices as sparse matrices.
+
+    Notes
+    -----
+    CSC matrices are also returned with sorted indices, which sparse
+    kernels of the solvers access sequentially. Input matrices with unsorted
+    indices are copied rather than sorted in place.
     """
+    if (
+        __is_sorted_csc(P)
+        and (G is None or __is_sorted_csc(G))
+        and (A is None or __is_sorted_csc(A))
+    ):
+        return P, G, A  # fast path for problems that are already sparse
     if isinstance(P, np.ndarray):
         __warn_about_sparse_conversion("P")
         P = spa.csc_matrix(P)
@@ -73,4 +101,10 @@ def ensure_sparse_matrices(
     if isinstance(A, np.ndarray):
         __warn_about_sparse_conversion("A")
         A = spa.csc_matrix(A)
+    if isinstance(P, spa.csc_matrix) and not P.has_sorted_indices:
+        P = P.sorted_indices()
+    if isinstance(G, spa.csc_matrix) and not G.has_sorted_indices:
+        G = G.sorted_indices()
+    if isinstance(A, spa.csc_matrix) and not A.has_sorted_indices:
+        A = A.sorted_indices()
     return P, G, A
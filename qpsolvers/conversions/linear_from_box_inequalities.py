@@ -75,6 +75,64 @@ def concatenate_bound(
     return (G, h)
 
 
+def concatenate_box_bounds(
+    G: Optional[Union[np.ndarray, spa.csc_matrix]],
+    h: Optional[np.ndarray],
+    lb: np.ndarray,
+    ub: np.ndarray,
+    use_sparse: bool,
+) -> Tuple[Optional[Union[np.ndarray, spa.csc_matrix]], Optional[np.ndarray]]:
+    """Append both lower and upper bound vectors to inequality constraints.
+
+    This is equivalent to two calls to :func:`concatenate_bound`, but copies
+    the linear inequality matrix only once.
+
+    Parameters
+    ----------
+    G :
+        Linear inequality matrix.
+    h :
+        Linear inequality vector.
+    lb :
+        Lower bound constraint vector.
+    ub :
+        Upper bound constraint vector.
+    use_sparse :
+        Use sparse matrices if true, dense matrices otherwise.
+
+    Returns
+    -------
+    G : numpy.ndarray, scipy.sparse.csc_matrix, or None
+        Updated linear inequality matrix.
+    h : numpy.ndarray or None
+        Updated linear inequality vector.
+    """
+    n = len(lb)  # == number of optimization variables
+    overwrite = G is None or h is None
+    sparse_box = use_sparse if overwrite else not isinstance(G, np.ndarray)
+    if sparse_box:
+        # Column j of [-I; I] has a -1 on row j and a +1 on row n + j
+        indices = np.empty(2 * n, dtype=np.int32)
+        indices[0::2] = np.arange(n)
+        indices[1::2] = np.arange(n, 2 * n)
+        data = np.tile([-1.0, 1.0], n)
+        indptr = np.arange(0, 2 * n + 1, 2, dtype=np.int32)
+        box = spa.csc_matrix((data, indices, indptr), shape=(2 * n, n))
+    else:  # dense matrices
+        eye = np.eye(n)
+        box = np.concatenate((-eye, eye), 0)
+    if overwrite:
+        return (box, np.concatenate((-lb, ub)))
+    if isinstance(G, np.ndarray):
+        G = np.concatenate((G, box), 0)
+    elif isinstance(G, (spa.csc_matrix, spa.dia_matrix)):
+        G = spa.vstack([G, box], format="csc")
+    else:  # G is not an instance of a type we know
+        name = type(G).__name__
+        raise ProblemError(f"invalid type '{name}' for inequality matrix G")
+    return (G, np.concatenate((h, -lb, ub)))
+
+
 def linear_from_box_inequalities(
     G: Optional[Union[np.ndarray, spa.csc_matrix]],
     h: Optional[np.ndarray],
@@ -104,6 +162,8 @@ def linear_from_box_inequalities(
     h : np.ndarray or None
         Updated linear inequality vector.
     """
+    if lb is not None and ub is not None:
+        return concatenate_box_bounds(G, h, lb, ub, use_sparse)
     if lb is not None:
         G, h = concatenate_bound(G, h, lb, -1.0, use_sparse)
     if ub is not None:
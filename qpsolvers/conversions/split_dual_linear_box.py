@@ -49,6 +49,11 @@ def split_dual_linear_box(
     :
         Pair :code:`z, z_box` of linear and box multipliers. Both can be empty
         arrays if there is no corresponding constraint.
+
+    Notes
+    -----
+    The linear multipliers :code:`z` are a view on the input vector rather
+    than a copy.
     """
     z = np.empty((0,))
     z_box = np.empty((0,))
@@ -220,6 +220,49 @@ class Problem:
             self.ub,
         )
 
+    def update(
+        self,
+        q: Optional[np.ndarray] = None,
+        h: Optional[np.ndarray] = None,
+        b: Optional[np.ndarray] = None,
+        lb: Optional[np.ndarray] = None,
+        ub: Optional[np.ndarray] = None,
+    ) -> None:
+        """Update problem vectors in place.
+
+        This is a cheaper alternative to building a new problem when only
+        vectors change between two solves, for instance in model predictive
+        control. The updated problem can then be passed again to
+        :func:`qpsolvers.solve_problem` or to a ``*_solve_problem`` function.
+
+        Parameters
+        ----------
+        q :
+            New cost vector, if any.
+        h :
+            New linear inequality vector, if any.
+        b :
+            New linear equality vector, if any.
+        lb :
+            New lower bound constraint vector, if any.
+        ub :
+            New upper bound constraint vector, if any.
+
+        Notes
+        -----
+        Vectors that are not set (``None``) keep their current values.
+        """
+        if q is not None:
+            self.q = Problem.__check_vector(q, "q")
+        if h is not None:
+            self.h = Problem.__check_vector(h, "h")
+        if b is not None:
+            self.b = Problem.__check_vector(b, "b")
+        if lb is not None:
+            self.lb = Problem.__check_vector(lb, "lb")
+        if ub is not None:
+            self.ub = Problem.__check_vector(ub, "ub")
+
     def check_constraints(self):
         """Check that problem constraints are properly specified.
 
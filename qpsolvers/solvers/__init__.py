@@ -42,6 +42,8 @@ clarabel_solve_problem: Optional[
             Problem,
             Optional[ndarray],
             bool,
+            bool,
+            bool,
         ],
         Solution,
     ]
@@ -60,13 +62,39 @@ clarabel_solve_qp: Optional[
             Optional[ndarray],
             Optional[ndarray],
             bool,
+            bool,
+            bool,
         ],
         Optional[ndarray],
     ]
 ] = None
 
+clarabel_solve_qp_batch: Optional[
+    Callable[
+        [
+            Union[ndarray, csc_matrix],
+            ndarray,
+            Optional[Union[ndarray, csc_matrix]],
+            Optional[ndarray],
+            Optional[Union[ndarray, csc_matrix]],
+            Optional[ndarray],
+            Optional[ndarray],
+            Optional[ndarray],
+            bool,
+            Optional[int],
+            bool,
+            bool,
+        ],
+        ndarray,
+    ]
+] = None
+
 try:
-    from .clarabel_ import clarabel_solve_problem, clarabel_solve_qp
+    from .clarabel_ import (
+        clarabel_solve_problem,
+        clarabel_solve_qp,
+        clarabel_solve_qp_batch,
+    )
 
     solve_function["clarabel"] = clarabel_solve_problem
     available_solvers.append("clarabel")
@@ -433,6 +461,7 @@ piqp_solve_qp: Optional[
             Optional[Union[ndarray, csc_matrix]],
             bool,
             Optional[str],
+            bool,
         ],
         Optional[ndarray],
     ]
@@ -445,6 +474,7 @@ piqp_solve_problem: Optional[
             Optional[Union[ndarray, csc_matrix]],
             bool,
             Optional[str],
+            bool,
         ],
         Solution,
     ]
@@ -688,6 +718,7 @@ if not available_solvers:
 __all__ = [
     "available_solvers",
     "clarabel_solve_qp",
+    "clarabel_solve_qp_batch",
     "cvxopt_solve_qp",
     "daqp_solve_qp",
     "dense_solvers",
@@ -29,27 +29,178 @@ soon (retrieved: 2023-02-06). Until then, the authors ask that you cite its
 documentation if you have found Clarabel.rs useful in your work.
 """
 
+import os
+import threading
 import warnings
-from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
 
 import clarabel
 import numpy as np
 import scipy.sparse as spa
+from scipy.sparse.csgraph import reverse_cuthill_mckee
 
 from ..conversions import (
+    ensure_float64,
     ensure_sparse_matrices,
     linear_from_box_inequalities,
     split_dual_linear_box,
 )
+from ..exceptions import ProblemError
 from ..problem import Problem
 from ..solution import Solution
 from ..solve_unconstrained import solve_unconstrained
 
+_VALID_SETTINGS = frozenset(
+    name
+    for name in dir(clarabel.DefaultSettings())
+    if not name.startswith("_")
+    and not callable(getattr(clarabel.DefaultSettings, name, None))
+)
+
+_thread_local = threading.local()
+_SOLVER_CACHE_SIZE: int = 8
+_PRESOLVE_INFINITE_BOUND: float = 1e20
+
+
+def __get_solver_cache() -> Dict[Tuple, "clarabel.DefaultSolver"]:
+    """Get the solver cache of the calling thread.
+
+    Returns
+    -------
+    :
+        Dictionary of cached solvers, indexed by problem structure.
+
+    Notes
+    -----
+    Each thread has its own cache, as a solver instance cannot solve two
+    problems at the same time.
+    """
+    if not hasattr(_thread_local, "solver_cache"):
+        _thread_local.solver_cache = {}
+    return _thread_local.solver_cache
+
+
+def __sparsity_key(M: spa.csc_matrix) -> Tuple:
+    """Fingerprint of the sparsity pattern of a CSC matrix.
+
+    Parameters
+    ----------
+    M :
+        Sparse matrix in CSC format.
+
+    Returns
+    -------
+    :
+        Hashable tuple identifying the shape and sparsity pattern of M.
+    """
+    return (M.shape, M.indptr.tobytes(), M.indices.tobytes())
+
+
+def __as_float_array(values: List[float]) -> np.ndarray:
+    """Convert a vector returned by Clarabel.rs to a NumPy array.
+
+    Parameters
+    ----------
+    values :
+        List of floats returned by the solver.
+
+    Returns
+    -------
+    :
+        Same values as a NumPy array.
+    """
+    return np.fromiter(values, dtype=np.float64, count=len(values))
+
+
+def __assemble_cones(
+    A: Optional[spa.csc_matrix],
+    b: Optional[np.ndarray],
+    G: Optional[spa.csc_matrix],
+    h: Optional[np.ndarray],
+) -> Tuple[spa.csc_matrix, np.ndarray, List[Tuple[type, int]]]:
+    """Stack equality and inequality constraints into Clarabel.rs cones.
+
+    Parameters
+    ----------
+    A :
+        Linear equality matrix, if any.
+    b :
+        Linear equality vector, if any.
+    G :
+        Linear inequality matrix, if any.
+    h :
+        Linear inequality vector, if any.
+
+    Returns
+    -------
+    :
+        Tuple ``(A_stack, b_stack, cone_dims)`` where ``A_stack`` and
+        ``b_stack`` stack equality then inequality constraints, and
+        ``cone_dims`` is the list of cone types and dimensions that
+        partitions their rows.
+    """
+    A_list = []
+    b_list = []
+    cone_dims: List[Tuple[type, int]] = []
+    if A is not None and b is not None:
+        A_list.append(A)
+        b_list.append(b)
+        cone_dims.append((clarabel.ZeroConeT, b.shape[0]))
+    if G is not None and h is not None:
+        A_list.append(G)
+        b_list.append(h)
+        cone_dims.append((clarabel.NonnegativeConeT, h.shape[0]))
+    if len(A_list) < 2:  # no stacking needed
+        return spa.csc_matrix(A_list[0]), b_list[0], cone_dims
+    # Copying CSC entries directly to their stacked positions with NumPy
+    # fancy indexing was benchmarked to be about twice slower than SciPy
+    # stacking beyond a few thousand nonzeros, so we let SciPy do it.
+    A_stack = spa.bmat([[A_list[0]], [A_list[1]]], format="csc")
+    meq = b_list[0].shape[0]
+    b_stack = np.empty(meq + b_list[1].shape[0])
+    b_stack[:meq] = b_list[0]
+    b_stack[meq:] = b_list[1]
+    return A_stack, b_stack, cone_dims
+
+
+def __cone_row_permutation(
+    A_stack: spa.csc_matrix, block_sizes: List[int]
+) -> np.ndarray:
+    """Reverse Cuthill-McKee permutation of constraint rows within cones.
+
+    Parameters
+    ----------
+    A_stack :
+        Stacked constraint matrix, in CSC format.
+    block_sizes :
+        Number of rows of each cone, in the order they appear in A_stack.
+
+    Returns
+    -------
+    :
+        Row permutation of A_stack that only permutes rows within each cone,
+        so that the cone layout of the problem is preserved.
+    """
+    A_rows = A_stack.tocsr()
+    perm_blocks = []
+    start = 0
+    for size in block_sizes:
+        block = A_rows[start : start + size]
+        graph = (block @ block.T).tocsr()
+        perm_blocks.append(
+            start + reverse_cuthill_mckee(graph, symmetric_mode=True)
+        )
+        start += size
+    return np.concatenate(perm_blocks)
+
 
 def clarabel_solve_problem(
     problem: Problem,
     initvals: Optional[np.ndarray] = None,
     verbose: bool = False,
+    cache: bool = False,
+    reorder: bool = False,
     **kwargs,
 ) -> Solution:
     r"""Solve a quadratic program using Clarabel.rs.
@@ -62,6 +213,17 @@ def clarabel_solve_problem(
         Warm-start guess vector.
     verbose :
         Set to `True` to print out extra information.
+    cache :
+        If ``True``, reuse the solver instance of a previous call when the
+        problem has the same sparsity pattern and solver settings. Only the
+        numerical values of the problem are then updated, which skips the
+        symbolic analysis of the KKT matrix. Solutions are then equal to those
+        of a new solver up to solver tolerances. Defaults to ``False``.
+    reorder :
+        If ``True``, permute constraint rows within each cone by reverse
+        Cuthill-McKee ordering before handing them to the solver. Clarabel.rs
+        computes its own fill-reducing ordering of the KKT matrix, so this
+        mostly affects memory locality. Defaults to ``False``.
 
     Returns
     -------
@@ -101,52 +263,107 @@ def clarabel_solve_problem(
     """
     if initvals is not None and verbose:
         warnings.warn("Clarabel: warm-start values are ignored")
-    P, q, G, h, A, b, lb, ub = problem.unpack()
+    unknown_settings = kwargs.keys() - _VALID_SETTINGS
+    if unknown_settings:
+        warnings.warn(
+            f"Ignoring undefined solver settings {sorted(unknown_settings)}"
+        )
+    P, q, G, h, A, b, lb, ub = ensure_float64(
+        problem.P,
+        problem.q,
+        problem.G,
+        problem.h,
+        problem.A,
+        problem.b,
+        problem.lb,
+        problem.ub,
+    )
     P, G, A = ensure_sparse_matrices(P, G, A)
     if lb is not None or ub is not None:
         G, h = linear_from_box_inequalities(G, h, lb, ub, use_sparse=True)
 
-    cones = []
-    A_list = []
-    b_list = []
-    if A is not None and b is not None:
-        A_list.append(A)
-        b_list.append(b)
-        cones.append(clarabel.ZeroConeT(b.shape[0]))
-    if G is not None and h is not None:
-        A_list.append(G)
-        b_list.append(h)
-        cones.append(clarabel.NonnegativeConeT(h.shape[0]))
-    if not A_list:
+    if (A is None or b is None) and (G is None or h is None):
         return solve_unconstrained(problem)
+    A_stack, b_stack, cone_dims = __assemble_cones(A, b, G, h)
+    perm: Optional[np.ndarray] = None
+    if reorder:
+        perm = __cone_row_permutation(A_stack, [dim for _, dim in cone_dims])
+        A_stack = A_stack[perm]
+        A_stack.sort_indices()
+        b_stack = b_stack[perm]
 
-    settings = clarabel.DefaultSettings()
-    settings.verbose = verbose
-    for key, value in kwargs.items():
-        setattr(settings, key, value)
+    # Data updates are only available from Clarabel.rs 0.7.0, and are not
+    # allowed when presolve removes infinite bounds from the problem. Presolve
+    # treats bounds at or above 1e20 as infinite, so that a cached solver set
+    # up with finite bounds cannot be updated to such bounds either.
+    cache = (
+        cache
+        and hasattr(clarabel.DefaultSolver, "update")
+        and not (np.abs(b_stack) >= _PRESOLVE_INFINITE_BOUND).any()
+    )
+    key: Optional[Tuple] = None
+    if cache:
+        key = (
+            __sparsity_key(P),
+            __sparsity_key(A_stack),
+            tuple(cone_dims),
+            verbose,
+            tuple(sorted(kwargs.items())),
+        )
+        try:
+            hash(key)
+        except TypeError:  # unhashable setting value
+            key = None
 
-    A_stack = spa.vstack(A_list, format="csc")
-    b_stack = np.concatenate(b_list)
-    solver = clarabel.DefaultSolver(P, q, A_stack, b_stack, cones, settings)
+    solver_cache = __get_solver_cache()
+    solver = solver_cache.get(key) if key is not None else None
+    if solver is not None:
+        # Clarabel.rs stores the upper triangular part of P internally
+        P_triu = spa.triu(P, format="csc")
+        solver.update(P=P_triu, q=q, A=A_stack, b=b_stack)
+    else:  # no cached solver
+        settings = clarabel.DefaultSettings()
+        settings.verbose = verbose
+        for setting, value in kwargs.items():
+            if setting in _VALID_SETTINGS:
+                setattr(settings, setting, value)
+        cones = [cone_type(dim) for cone_type, dim in cone_dims]
+        solver = clarabel.DefaultSolver(
+            P, q, A_stack, b_stack, cones, settings
+        )
+        if key is not None and solver.is_data_update_allowed():
+            if len(solver_cache) >= _SOLVER_CACHE_SIZE:
+                del solver_cache[next(iter(solver_cache))]
+            solver_cache[key] = solver
     result = solver.solve()
 
+    # Each access to a result attribute converts a Rust vector to a new
+    # Python list, so that we fetch result vectors only once. Dual vectors
+    # below are then views on a single array.
+    z_stacked = __as_float_array(result.z)
+    s_stacked = __as_float_array(result.s)
+    if perm is not None:
+        z_stacked[perm] = z_stacked.copy()
+        s_stacked[perm] = s_stacked.copy()
+
+    status = result.status
     solution = Solution(problem)
     solution.obj = result.obj_val
     solution.extras = {
-        "s": result.s,
-        "status": result.status,
+        "s": s_stacked,
+        "status": status,
         "solve_time": result.solve_time,
     }
 
-    solution.found = result.status == clarabel.SolverStatus.Solved
+    solution.found = status == clarabel.SolverStatus.Solved
     if not solution.found:
-        warnings.warn(f"Clarabel.rs terminated with status {result.status}")
+        warnings.warn(f"Clarabel.rs terminated with status {status}")
 
-    solution.x = np.array(result.x)
+    solution.x = __as_float_array(result.x)
     meq = A.shape[0] if A is not None else 0
-    solution.y = result.z[:meq] if meq > 0 else np.empty((0,))
+    solution.y = z_stacked[:meq] if meq > 0 else np.empty((0,))
     if G is not None:
-        z, z_box = split_dual_linear_box(np.array(result.z[meq:]), lb, ub)
+        z, z_box = split_dual_linear_box(z_stacked[meq:], lb, ub)
         solution.z = z
         solution.z_box = z_box
     else:  # G is None
@@ -166,6 +383,8 @@ def clarabel_solve_qp(
     ub: Optional[np.ndarray] = None,
     initvals: Optional[np.ndarray] = None,
     verbose: bool = False,
+    cache: bool = False,
+    reorder: bool = False,
     **kwargs,
 ) -> Optional[np.ndarray]:
     r"""Solve a quadratic program using Clarabel.rs.
@@ -207,6 +426,12 @@ def clarabel_solve_qp(
         Warm-start guess vector.
     verbose :
         Set to `True` to print out extra information.
+    cache :
+        If ``True``, reuse the solver instance of a previous call when the
+        problem has the same sparsity pattern and solver settings.
+    reorder :
+        If ``True``, permute constraint rows within each cone by reverse
+        Cuthill-McKee ordering before handing them to the solver.
 
     Returns
     -------
@@ -214,5 +439,127 @@ def clarabel_solve_qp(
         Primal solution to the QP, if found, otherwise ``None``.
     """
     problem = Problem(P, q, G, h, A, b, lb, ub)
-    solution = clarabel_solve_problem(problem, initvals, verbose, **kwargs)
+    solution = clarabel_solve_problem(
+        problem, initvals, verbose, cache, reorder, **kwargs
+    )
     return solution.x if solution.found else None
+
+
+def clarabel_solve_qp_batch(
+    P: Union[np.ndarray, spa.csc_matrix],
+    q: np.ndarray,
+    G: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+    h: Optional[np.ndarray] = None,
+    A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+    b: Optional[np.ndarray] = None,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
+    verbose: bool = False,
+    n_jobs: Optional[int] = None,
+    cache: bool = True,
+    reorder: bool = False,
+    **kwargs,
+) -> np.ndarray:
+    r"""Solve a batch of quadratic programs using Clarabel.rs.
+
+    All quadratic programs in the batch share the same matrices and bounds,
+    and differ by their vectors :math:`q`, and optionally :math:`h` and
+    :math:`b`. Each one is defined as in :func:`clarabel_solve_qp`.
+
+    Parameters
+    ----------
+    P :
+        Symmetric cost matrix.
+    q :
+        Cost vectors of the :math:`K` problems, stacked as the rows of a
+        :math:`K \times n` array.
+    G :
+        Linear inequality matrix.
+    h :
+        Linear inequality vector, or vectors of the :math:`K` problems
+        stacked as the rows of a two-dimensional array.
+    A :
+        Linear equality constraint matrix.
+    b :
+        Linear equality constraint vector, or vectors of the :math:`K`
+        problems stacked as the rows of a two-dimensional array.
+    lb :
+        Lower bound constraint vector.
+    ub :
+        Upper bound constraint vector.
+    verbose :
+        Set to `True` to print out extra information.
+    n_jobs :
+        Number of threads solving problems in parallel. If ``None``
+        (default) or negative, use as many threads as there are processors.
+    cache :
+        If ``True`` (default), each thread reuses its solver instance across
+        the problems it solves. See :func:`clarabel_solve_problem`.
+    reorder :
+        If ``True``, permute constraint rows within each cone by reverse
+        Cuthill-McKee ordering before handing them to the solver.
+
+    Returns
+    -------
+    :
+        Primal solutions stacked as the rows of a :math:`K \times n` array.
+        Rows of problems for which no solution was found are set to NaN.
+
+    Raises
+    ------
+    ProblemError
+        If the cost vectors are not stacked in a two-dimensional array, or
+        if stacked constraint vectors do not have one row per problem.
+
+    Notes
+    -----
+    Each thread solves a contiguous chunk of the batch and reuses its solver
+    instance across problems, so that the symbolic analysis of the KKT
+    matrix is performed once per thread. Solvers cannot be reused when some
+    bounds in :math:`h`, :math:`b`, :math:`lb` or :math:`ub` are infinite or
+    have a magnitude of 1e20 or more, as Clarabel.rs presolve removes them:
+    a new solver is then set up for every problem. Threads run in parallel
+    as long as the solver releases the global interpreter lock. Keyword
+    arguments are forwarded as options to Clarabel.rs.
+    """
+    if q.ndim != 2:
+        raise ProblemError(
+            f"cost vectors 'q' should be stacked as rows of a two-dimensional "
+            f"array, but their shape is {q.shape}"
+        )
+    nb_problems, n = q.shape
+    for name, v in (("h", h), ("b", b)):
+        if v is not None and v.ndim == 2 and v.shape[0] != nb_problems:
+            raise ProblemError(
+                f"vectors '{name}' are stacked as {v.shape[0]} rows "
+                f"but there are {nb_problems} cost vectors"
+            )
+    x_batch = np.empty((nb_problems, n))
+
+    def solve_chunk(chunk: np.ndarray) -> None:
+        problem: Optional[Problem] = None
+        for k in chunk:
+            h_k = h[k] if h is not None and h.ndim == 2 else h
+            b_k = b[k] if b is not None and b.ndim == 2 else b
+            if problem is None:
+                problem = Problem(P, q[k], G, h_k, A, b_k, lb, ub)
+            else:  # same matrices, only vectors change
+                problem.update(q=q[k], h=h_k, b=b_k)
+            solution = clarabel_solve_problem(
+                problem,
+                verbose=verbose,
+                cache=cache,
+                reorder=reorder,
+                **kwargs,
+            )
+            x_batch[k] = solution.x if solution.found else np.nan
+
+    if n_jobs is None or n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    nb_threads = max(1, min(n_jobs, nb_problems))
+    chunks = np.array_split(np.arange(nb_problems), nb_threads)
+    with ThreadPoolExecutor(max_workers=nb_threads) as executor:
+        futures = [executor.submit(solve_chunk, chunk) for chunk in chunks]
+        for future in futures:
+            future.result()
+    return x_batch
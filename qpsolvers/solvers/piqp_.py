@@ -29,18 +29,148 @@ handle ill-conditioned convex QP problems without the need for linear
 independence of the constraints. [schwan2023piqp]_
 """
 
+import threading
 import warnings
-from typing import Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 import numpy as np
 import piqp
 import scipy.sparse as spa
 
-from ..conversions import ensure_sparse_matrices
+from ..conversions import ensure_float64, ensure_sparse_matrices
 from ..exceptions import ParamError, ProblemError
 from ..problem import Problem
 from ..solution import Solution
 
+_VALID_SETTINGS = frozenset(
+    name
+    for name in dir(piqp.DenseSolver().settings)
+    if not name.startswith("_")
+)
+
+_thread_local = threading.local()
+_SOLVER_CACHE_SIZE: int = 8
+_PIQP_INFINITY: float = 1e30
+_LARGE_BOUND: float = 1e20
+
+
+def __get_solver_cache() -> (
+    Dict[Tuple, Union[piqp.DenseSolver, piqp.SparseSolver]]
+):
+    """Get the solver cache of the calling thread.
+
+    Returns
+    -------
+    :
+        Dictionary of cached solvers, indexed by problem structure.
+
+    Notes
+    -----
+    Each thread has its own cache, as a solver instance cannot solve two
+    problems at the same time.
+    """
+    if not hasattr(_thread_local, "solver_cache"):
+        _thread_local.solver_cache = {}
+    return _thread_local.solver_cache
+
+
+def __structure_key(M: Union[np.ndarray, spa.csc_matrix]) -> Tuple:
+    """Fingerprint of the structure of a problem matrix.
+
+    Parameters
+    ----------
+    M :
+        Problem matrix.
+
+    Returns
+    -------
+    :
+        Hashable tuple identifying the shape of M, as well as its sparsity
+        pattern if M is a sparse matrix.
+    """
+    if isinstance(M, np.ndarray):
+        return (M.shape,)
+    if not isinstance(M, spa.csc_matrix):
+        M = spa.csc_matrix(M)
+    return (M.shape, M.indptr.tobytes(), M.indices.tobytes())
+
+
+def __finite_key(v: Optional[np.ndarray]) -> Optional[bytes]:
+    """Fingerprint of the bounds of a vector that PIQP registers at setup.
+
+    Parameters
+    ----------
+    v :
+        Bound vector, if any.
+
+    Returns
+    -------
+    :
+        Bytes of the mask of entries below PIQP's infinity, if any.
+    """
+    if v is None:
+        return None
+    return (np.abs(v) < _PIQP_INFINITY).tobytes()
+
+
+def __warn_about_dense_conversion(matrix_name: str) -> None:
+    """Warn about conversion from sparse to dense matrix.
+
+    Parameters
+    ----------
+    matrix_name :
+        Name of matrix being converted from sparse to dense.
+    """
+    warnings.warn(
+        f"Converted {matrix_name} to numpy.ndarray\n"
+        f"For best performance, build {matrix_name} as a "
+        "numpy.ndarray rather than as a scipy.sparse.csc_matrix"
+    )
+
+
+def __use_sparse_matrices(
+    backend: Optional[str],
+    P: Union[np.ndarray, spa.csc_matrix],
+    G: Optional[Union[np.ndarray, spa.csc_matrix]],
+    A: Optional[Union[np.ndarray, spa.csc_matrix]],
+) -> bool:
+    """Check whether problem matrices should be passed as sparse matrices.
+
+    Parameters
+    ----------
+    backend :
+        PIQP backend to use in ``[None, "dense", "sparse"]``.
+    P :
+        Cost matrix.
+    G :
+        Inequality constraint matrix, if any.
+    A :
+        Equality constraint matrix, if any.
+
+    Returns
+    -------
+    :
+        True if matrices should be sparse, False if they should be dense.
+
+    Notes
+    -----
+    When the backend is not specified and the problem mixes dense and sparse
+    matrices, we convert the matrices whose conversion involves the fewest
+    entries. For instance, a large dense cost matrix with a few sparse
+    equality constraints yields a dense problem.
+    """
+    if backend == "dense":
+        return False
+    if backend == "sparse":
+        return True
+    dense_size = sum(M.size for M in (P, G, A) if isinstance(M, np.ndarray))
+    sparse_size = sum(
+        M.shape[0] * M.shape[1]
+        for M in (P, G, A)
+        if M is not None and not isinstance(M, np.ndarray)
+    )
+    return sparse_size > dense_size
+
 
 def __select_backend(backend: Optional[str], use_csc: bool):
     """Select backend function for PIQP.
@@ -77,6 +207,7 @@ def piqp_solve_problem(
     initvals: Optional[np.ndarray] = None,
     verbose: bool = False,
     backend: Optional[str] = None,
+    cache: bool = False,
     **kwargs,
 ) -> Solution:
     """Solve a quadratic program using PIQP.
@@ -89,9 +220,18 @@ def piqp_solve_problem(
         Warm-start guess vector (not used).
     backend :
         PIQP backend to use in ``[None, "dense", "sparse"]``. If ``None``
-        (default), the backend is selected based on the type of ``P``.
+        (default), the backend is selected based on the types of ``P``,
+        ``G`` and ``A``.
     verbose :
         Set to `True` to print out extra information.
+    cache :
+        If ``True``, reuse the solver instance of a previous call when the
+        problem has the same structure and solver settings. Only the numerical
+        values of the problem are then updated, which skips the symbolic setup
+        of the solver. Solutions are then equal to those of a new solver up
+        to solver tolerances, and ``extras["info"]`` reports on the latest
+        solve of the cached solver. The cache is skipped when a bound has a
+        magnitude of 1e20 or more. Defaults to ``False``.
 
     Returns
     -------
@@ -168,11 +308,25 @@ def piqp_solve_problem(
     This list is not exhaustive. Check out the `solver documentation
     <https://predict-epfl.github.io/piqp/interfaces/settings>`__ for details.
     """
-    P, q, G, h, A, b, lb, ub = problem.unpack()
+    P, q, G, h, A, b, lb, ub = ensure_float64(
+        problem.P,
+        problem.q,
+        problem.G,
+        problem.h,
+        problem.A,
+        problem.b,
+        problem.lb,
+        problem.ub,
+    )
     n: int = q.shape[0]
 
     if initvals is not None and verbose:
         warnings.warn("warm-start values are ignored by PIQP")
+    unknown_settings = kwargs.keys() - _VALID_SETTINGS
+    if unknown_settings:
+        warnings.warn(
+            f"Ignoring undefined solver settings {sorted(unknown_settings)}"
+        )
 
     if G is None and h is not None:
         raise ProblemError(
@@ -186,48 +340,101 @@ def piqp_solve_problem(
         )
     if A is not None and b is None:
         raise ProblemError("Inconsistent inequalities: A is set but b is None")
+    use_csc: bool = __use_sparse_matrices(backend, P, G, A)
+    if not use_csc:
+        if not isinstance(P, np.ndarray):
+            __warn_about_dense_conversion("P")
+            P = P.toarray()
+        if G is not None and not isinstance(G, np.ndarray):
+            __warn_about_dense_conversion("G")
+            G = G.toarray()
+        if A is not None and not isinstance(A, np.ndarray):
+            __warn_about_dense_conversion("A")
+            A = A.toarray()
     # PIQP does not support A, b, G, and h to be None.
-    G_piqp = np.zeros((0, n)) if G is None else G
+    if use_csc:
+        G_piqp = spa.csc_matrix((0, n)) if G is None else G
+        A_piqp = spa.csc_matrix((0, n)) if A is None else A
+    else:  # dense matrices
+        G_piqp = np.zeros((0, n)) if G is None else G
+        A_piqp = np.zeros((0, n)) if A is None else A
     h_piqp = np.zeros((0,)) if h is None else h
-    A_piqp = np.zeros((0, n)) if A is None else A
     b_piqp = np.zeros((0,)) if b is None else b
-    use_csc: bool = (
-        not isinstance(P, np.ndarray)
-        or (G is not None and not isinstance(G, np.ndarray))
-        or (A is not None and not isinstance(A, np.ndarray))
-    )
     if use_csc is True:
         P, G_piqp, A_piqp = ensure_sparse_matrices(P, G_piqp, A_piqp)
 
-    solver = __select_backend(backend, use_csc)
-    solver.settings.verbose = verbose
-    for key, value in kwargs.items():
+    # PIQP only keeps track at setup of bounds below its infinity of 1e30,
+    # and a solver set up with moderate bounds fails after an update to huge
+    # ones, so that we skip the cache when any bound has a large magnitude.
+    cache = cache and not any(
+        (np.abs(v) >= _LARGE_BOUND).any()
+        for v in (h_piqp, lb, ub)
+        if v is not None
+    )
+    key: Optional[Tuple] = None
+    if cache:
+        key = (
+            backend,
+            use_csc,
+            __structure_key(P),
+            __structure_key(G_piqp),
+            __structure_key(A_piqp),
+            __finite_key(h_piqp),
+            __finite_key(lb),
+            __finite_key(ub),
+            verbose,
+            tuple(sorted(kwargs.items())),
+        )
         try:
-            setattr(solver.settings, key, value)
-        except AttributeError:
-            if verbose:
-                warnings.warn(
-                    f"Received an undefined solver setting {key}\
-                    with value {value}"
-                )
-    solver.setup(P, q, A_piqp, b_piqp, G_piqp, h_piqp, lb, ub)
+            hash(key)
+        except TypeError:  # unhashable setting value
+            key = None
+
+    solver_cache = __get_solver_cache()
+    solver = solver_cache.get(key) if key is not None else None
+    if solver is not None:
+        solver.update(
+            P=P,
+            c=q,
+            A=A_piqp,
+            b=b_piqp,
+            G=G_piqp,
+            h=h_piqp,
+            x_lb=lb,
+            x_ub=ub,
+        )
+    else:  # no cached solver
+        solver = __select_backend(backend, use_csc)
+        solver.settings.verbose = verbose
+        for setting, value in kwargs.items():
+            if setting in _VALID_SETTINGS:
+                setattr(solver.settings, setting, value)
+        solver.setup(P, q, A_piqp, b_piqp, G_piqp, h_piqp, lb, ub)
+        if key is not None:
+            if len(solver_cache) >= _SOLVER_CACHE_SIZE:
+                del solver_cache[next(iter(solver_cache))]
+            solver_cache[key] = solver
     status = solver.solve()
     success_status = piqp.PIQP_SOLVED
 
+    result = solver.result
     solution = Solution(problem)
-    solution.extras = {"info": solver.result.info}
+    solution.extras = {"info": result.info}
     solution.found = status == success_status
-    solution.x = solver.result.x
+    # Result vectors are read-only views on the memory of the solver, which
+    # is overwritten by the next solve when the solver is cached.
+    copy = key is not None
+    solution.x = result.x.copy() if copy else result.x
     if A is None:
         solution.y = np.empty((0,))
     else:
-        solution.y = solver.result.y
+        solution.y = result.y.copy() if copy else result.y
     if G is None:
         solution.z = np.empty((0,))
     else:
-        solution.z = solver.result.z
+        solution.z = result.z.copy() if copy else result.z
     if lb is not None or ub is not None:
-        solution.z_box = solver.result.z_ub - solver.result.z_lb
+        solution.z_box = result.z_ub - result.z_lb
     else:
         solution.z_box = np.empty((0,))
     return solution
@@ -245,6 +452,7 @@ def piqp_solve_qp(
     initvals: Optional[np.ndarray] = None,
     verbose: bool = False,
     backend: Optional[str] = None,
+    cache: bool = False,
     **kwargs,
 ) -> Optional[np.ndarray]:
     r"""Solve a quadratic program using PIQP.
@@ -285,11 +493,15 @@ def piqp_solve_qp(
         Upper bound constraint vector.
     backend :
         PIQP backend to use in ``[None, "dense", "sparse"]``. If ``None``
-        (default), the backend is selected based on the type of ``P``.
+        (default), the backend is selected based on the types of ``P``,
+        ``G`` and ``A``.
     verbose :
         Set to `True` to print out extra information.
     initvals :
         Warm-start guess vector. Not used.
+    cache :
+        If ``True``, reuse the solver instance of a previous call when the
+        problem has the same structure and solver settings.
 
     Returns
     -------
@@ -298,6 +510,6 @@ def piqp_solve_qp(
     """
     problem = Problem(P, q, G, h, A, b, lb, ub)
     solution = piqp_solve_problem(
-        problem, initvals, verbose, backend, **kwargs
+        problem, initvals, verbose, backend, cache, **kwargs
     )
     return solution.x if solution.found else None
@@ -23,12 +23,19 @@
 import unittest
 import warnings
 
+import numpy as np
+
+from qpsolvers.exceptions import ProblemError
 from qpsolvers.problems import get_qpsut01
 
 try:
     import clarabel
 
-    from qpsolvers.solvers.clarabel_ import clarabel_solve_problem
+    from qpsolvers.solvers.clarabel_ import (
+        clarabel_solve_problem,
+        clarabel_solve_qp,
+        clarabel_solve_qp_batch,
+    )
 
     class TestClarabel(unittest.TestCase):
         """Test fixture for the Clarabel.rs solver."""
@@ -54,5 +61,115 @@ try:
             check_2 = status != clarabel.SolverStatus.Solved
             self.assertEqual(check_1, check_2)
 
+        def test_unknown_setting(self):
+            """Unknown solver settings are skipped with a warning."""
+            problem, _ = get_qpsut01()
+            with self.assertWarnsRegex(UserWarning, "unknown_setting"):
+                solution = clarabel_solve_problem(problem, unknown_setting=42)
+            self.assertTrue(solution.found)
+
+        def test_solver_cache(self):
+            """Cached and uncached solvers return the same solutions."""
+            problem, _ = get_qpsut01()
+            problem.q = problem.q + 1.0
+            clarabel_solve_problem(problem, cache=True)  # fill the cache
+            problem.q = problem.q - 1.0
+            cached = clarabel_solve_problem(problem, cache=True)
+            uncached = clarabel_solve_problem(problem)
+            self.assertTrue(cached.found)
+            self.assertTrue(np.allclose(cached.x, uncached.x, atol=1e-6))
+            self.assertTrue(np.allclose(cached.z, uncached.z, atol=1e-6))
+
+        def test_solver_cache_large_bounds(self):
+            """Bounds removed by presolve are not updated in cached solvers."""
+            problem, _ = get_qpsut01()
+            clarabel_solve_problem(problem, cache=True)  # fill the cache
+            problem.ub = np.full(problem.q.shape, 1e30)
+            cached = clarabel_solve_problem(problem, cache=True)
+            uncached = clarabel_solve_problem(problem)
+            self.assertEqual(
+                cached.extras["status"], uncached.extras["status"]
+            )
+            self.assertTrue(np.allclose(cached.x, uncached.x, atol=1e-6))
+
+        def test_reorder(self):
+            """Reordering constraint rows does not change the solution."""
+            problem, _ = get_qpsut01()
+            ref = clarabel_solve_problem(problem)
+            solution = clarabel_solve_problem(problem, reorder=True)
+            self.assertTrue(solution.found)
+            self.assertTrue(np.allclose(solution.x, ref.x, atol=1e-6))
+            self.assertTrue(np.allclose(solution.y, ref.y, atol=1e-6))
+            self.assertTrue(np.allclose(solution.z, ref.z, atol=1e-6))
+            self.assertIsInstance(ref.extras["s"], np.ndarray)
+            self.assertIsInstance(solution.extras["s"], np.ndarray)
+            self.assertTrue(
+                np.allclose(solution.extras["s"], ref.extras["s"], atol=1e-6)
+            )
+
+        def test_solve_qp_batch(self):
+            """Batch solutions match solutions of individual problems."""
+            problem, _ = get_qpsut01()
+            P, q, G, h, A, b, lb, ub = problem.unpack()
+            q_batch = np.array([q, q + 1.0, q - 1.0, 2.0 * q, -q])
+            h_batch = np.array([h, h, h + 1.0, h, h + 0.5])
+            x_batch = clarabel_solve_qp_batch(
+                P, q_batch, G, h_batch, A, b, lb, ub, n_jobs=2
+            )
+            self.assertEqual(x_batch.shape, q_batch.shape)
+            for k in range(q_batch.shape[0]):
+                x = clarabel_solve_qp(
+                    P, q_batch[k], G, h_batch[k], A, b, lb, ub
+                )
+                self.assertTrue(np.allclose(x_batch[k], x, atol=1e-6))
+
+        def test_solve_qp_batch_all_cores(self):
+            """Negative numbers of jobs run on all processors."""
+            problem, _ = get_qpsut01()
+            P, q, G, h, A, b, lb, ub = problem.unpack()
+            q_batch = np.array([q, q + 1.0])
+            x_batch = clarabel_solve_qp_batch(
+                P, q_batch, G, h, A, b, lb, ub, n_jobs=-1
+            )
+            x = clarabel_solve_qp(P, q_batch[1], G, h, A, b, lb, ub)
+            self.assertTrue(np.allclose(x_batch[1], x, atol=1e-6))
+
+        def test_solve_qp_batch_options(self):
+            """Batch solver options can be set along with solver settings."""
+            problem, _ = get_qpsut01()
+            P, q, G, h, A, b, lb, ub = problem.unpack()
+            q_batch = np.array([q, q + 1.0])
+            x_batch = clarabel_solve_qp_batch(
+                P,
+                q_batch,
+                G,
+                h,
+                A,
+                b,
+                lb,
+                ub,
+                cache=False,
+                reorder=True,
+                max_iter=100,
+            )
+            x = clarabel_solve_qp(P, q_batch[1], G, h, A, b, lb, ub)
+            self.assertTrue(np.allclose(x_batch[1], x, atol=1e-6))
+
+        def test_solve_qp_batch_stacked_rows(self):
+            """Exception raised when stacked vectors miss some problems."""
+            problem, _ = get_qpsut01()
+            P, q, G, h, A, b, lb, ub = problem.unpack()
+            q_batch = np.array([q, q + 1.0, q - 1.0])
+            h_batch = np.array([h, h])
+            with self.assertRaises(ProblemError):
+                clarabel_solve_qp_batch(P, q_batch, G, h_batch, A, b, lb, ub)
+
+        def test_solve_qp_batch_flat_cost(self):
+            """Exception raised when cost vectors are not stacked in 2D."""
+            problem, _ = get_qpsut01()
+            P, q, G, h, A, b, lb, ub = problem.unpack()
+            with self.assertRaises(ProblemError):
+                clarabel_solve_qp_batch(P, q, G, h, A, b, lb, ub)
+
 except ImportError:  # solver not installed
     warnings.warn("Skipping Clarabel.rs tests as the solver is not installed")
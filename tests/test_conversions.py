@@ -21,11 +21,16 @@
 """Unit tests for internal conversion functions."""
 
 import unittest
+import warnings
 
 import numpy as np
 import scipy.sparse as spa
 
-from qpsolvers.conversions import linear_from_box_inequalities
+from qpsolvers.conversions import (
+    ensure_float64,
+    ensure_sparse_matrices,
+    linear_from_box_inequalities,
+)
 
 
 class TestConversions(unittest.TestCase):
@@ -90,3 +95,90 @@ class TestConversions(unittest.TestCase):
             None, None, lb, ub, use_sparse=True
         )
         self.assertTrue(isinstance(G, spa.csc_matrix))
+
+    def test_sparse_box_inequalities(self):
+        """
+        Sparse box concatenation matches its dense counterpart.
+        """
+        G = np.array([[1.0, 2.0, 1.0], [2.0, 0.0, 1.0], [-1.0, 2.0, -1.0]])
+        h = np.array([3.0, 2.0, -2.0])
+        lb = np.array([-1.0, -2.0, -3.0])
+        ub = np.array([1.0, 2.0, 3.0])
+        G_dense, h_dense = linear_from_box_inequalities(
+            G, h, lb, ub, use_sparse=False
+        )
+        G_sparse, h_sparse = linear_from_box_inequalities(
+            spa.csc_matrix(G), h, lb, ub, use_sparse=True
+        )
+        self.assertTrue(isinstance(G_sparse, spa.csc_matrix))
+        self.assertTrue(np.allclose(G_sparse.toarray(), G_dense))
+        self.assertTrue(np.allclose(h_sparse, h_dense))
+
+    def test_ensure_sparse_matrices_already_sparse(self):
+        """
+        Matrices that are already in CSC format are returned as is.
+        """
+        P = spa.eye(3, format="csc")
+        A = spa.csc_matrix(np.ones((1, 3)))
+        P2, G2, A2 = ensure_sparse_matrices(P, None, A)
+        self.assertIs(P2, P)
+        self.assertIsNone(G2)
+        self.assertIs(A2, A)
+
+    def test_ensure_float64(self):
+        """
+        Single-precision matrices and vectors are converted to double.
+        """
+        P = spa.eye(3, format="csc", dtype=np.float32)
+        q = np.ones(3, dtype=np.float32)
+        lb = np.zeros(3)
+        with self.assertWarns(UserWarning):
+            P2, q2, G2, _, _, _, lb2, _ = ensure_float64(
+                P, q, None, None, None, None, lb, None
+            )
+        self.assertEqual(P2.dtype, np.float64)
+        self.assertTrue(isinstance(P2, spa.csc_matrix))
+        self.assertEqual(q2.dtype, np.float64)
+        self.assertIsNone(G2)
+        self.assertIs(lb2, lb)
+
+    def test_ensure_float64_integers(self):
+        """
+        Integer vectors are converted to double without warning.
+        """
+        P = np.eye(3)
+        q = np.array([1, 2, 3])
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            _, q2, _, _, _, _, _, _ = ensure_float64(
+                P, q, None, None, None, None, None, None
+            )
+        self.assertEqual(q2.dtype, np.float64)
+
+    def test_ensure_float64_contiguous(self):
+        """
+        Non-contiguous vectors are made contiguous, others are left as is.
+        """
+        P = np.eye(3)
+        q = np.ones((3, 2))[:, 0]
+        lb = np.zeros(3)
+        _, q2, _, _, _, _, lb2, _ = ensure_float64(
+            P, q, None, None, None, None, lb, None
+        )
+        self.assertTrue(q2.flags.c_contiguous)
+        self.assertTrue(np.allclose(q2, q))
+        self.assertIs(lb2, lb)
+
+    def test_ensure_sparse_matrices_sorted_indices(self):
+        """
+        Sparse matrices with unsorted indices are sorted without changing
+        the input matrix.
+        """
+        indptr = np.array([0, 2, 3])
+        indices = np.array([1, 0, 1])
+        data = np.array([1.0, 2.0, 3.0])
+        P = spa.csc_matrix((data, indices, indptr), shape=(2, 2))
+        P2, _, _ = ensure_sparse_matrices(P, None, None)
+        self.assertTrue(P2.has_sorted_indices)
+        self.assertTrue(np.allclose(P2.toarray(), P.toarray()))
+        self.assertTrue(np.array_equal(P.indices, indices))
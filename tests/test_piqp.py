@@ -22,13 +22,17 @@
 
 import unittest
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import scipy.sparse as spa
 
 from qpsolvers.exceptions import ParamError, ProblemError
 
 from .problems import get_sd3310_problem
 
 try:
-    from qpsolvers.solvers.piqp_ import piqp_solve_qp
+    from qpsolvers.solvers.piqp_ import _thread_local, piqp_solve_qp
 
     class TestPIQP(unittest.TestCase):
         """Test fixture specific to the PIQP solver."""
@@ -61,6 +65,156 @@ try:
             )
             self.assertIsNotNone(sol)
 
+        def test_sparse_placeholders(self):
+            """Missing constraints are not converted from dense to sparse."""
+            P = spa.csc_matrix(np.eye(3))
+            q = np.ones(3)
+            A = spa.csc_matrix(np.ones((1, 3)))
+            b = np.ones(1)
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                x = piqp_solve_qp(P, q, A=A, b=b, backend="sparse")
+            self.assertIsNotNone(x)
+            self.assertTrue(np.allclose(x, [1.0 / 3] * 3))
+
+        def test_solver_cache(self):
+            """Cached and uncached solvers return the same solutions."""
+            problem = get_sd3310_problem()
+            for backend in ("dense", "sparse"):
+                piqp_solve_qp(
+                    problem.P,
+                    problem.q + 1.0,
+                    problem.G,
+                    problem.h,
+                    problem.A,
+                    problem.b,
+                    backend=backend,
+                    cache=True,
+                )  # first call fills the cache
+                x_cached = piqp_solve_qp(
+                    problem.P,
+                    problem.q,
+                    problem.G,
+                    problem.h,
+                    problem.A,
+                    problem.b,
+                    backend=backend,
+                    cache=True,
+                )
+                x_uncached = piqp_solve_qp(
+                    problem.P,
+                    problem.q,
+                    problem.G,
+                    problem.h,
+                    problem.A,
+                    problem.b,
+                    backend=backend,
+                )
+                self.assertIsNotNone(x_cached)
+                self.assertTrue(np.allclose(x_cached, x_uncached, atol=1e-6))
+
+        def test_solver_cache_results(self):
+            """Solutions are not overwritten by a cached solver."""
+            P = np.eye(2)
+            lb, ub = np.full(2, -5.0), np.ones(2)
+            x1 = piqp_solve_qp(P, np.ones(2), lb=lb, ub=ub, cache=True)
+            x2 = piqp_solve_qp(P, -np.ones(2), lb=lb, ub=ub, cache=True)
+            self.assertTrue(np.allclose(x1, [-1.0, -1.0], atol=1e-6))
+            self.assertTrue(np.allclose(x2, [1.0, 1.0], atol=1e-6))
+
+        def test_solver_cache_large_bounds(self):
+            """Bounds PIQP deems infinite are not updated in cached solvers."""
+            P = np.eye(2)
+            q = np.full(2, -5.0)
+            lb = np.full(2, -5.0)
+            for backend in ("dense", "sparse"):
+                for ub_first, ub_second in ((1e30, 1.0), (1.0, 1e20)):
+                    piqp_solve_qp(
+                        P,
+                        q,
+                        lb=lb,
+                        ub=np.full(2, ub_first),
+                        backend=backend,
+                        cache=True,
+                    )  # first call fills the cache
+                    x = piqp_solve_qp(
+                        P,
+                        q,
+                        lb=lb,
+                        ub=np.full(2, ub_second),
+                        backend=backend,
+                        cache=True,
+                    )
+                    self.assertIsNotNone(x)
+                    x_ref = np.minimum(5.0, ub_second)
+                    self.assertTrue(np.allclose(x, x_ref, atol=1e-4))
+
+        def test_unknown_setting(self):
+            """Unknown solver settings are skipped with a warning."""
+            problem = get_sd3310_problem()
+            with self.assertWarnsRegex(UserWarning, "unknown_setting"):
+                x = piqp_solve_qp(
+                    problem.P,
+                    problem.q,
+                    problem.G,
+                    problem.h,
+                    problem.A,
+                    problem.b,
+                    unknown_setting=42,
+                )
+            self.assertIsNotNone(x)
+
+        def test_solver_cache_threads(self):
+            """Solvers cached in one thread are not shared with others."""
+            P = np.eye(2)
+            lb, ub = np.full(2, -5.0), np.ones(2)
+            piqp_solve_qp(P, np.ones(2), lb=lb, ub=ub, cache=True)
+
+            def cache_size() -> int:
+                return len(getattr(_thread_local, "solver_cache", {}))
+
+            self.assertGreater(cache_size(), 0)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                self.assertEqual(executor.submit(cache_size).result(), 0)
+
+        def test_mixed_dense_sparse(self):
+            """Dense and sparse matrices can be mixed in a problem."""
+            problem = get_sd3310_problem()
+            x_ref = piqp_solve_qp(
+                problem.P,
+                problem.q,
+                problem.G,
+                problem.h,
+                problem.A,
+                problem.b,
+            )
+            for backend in (None, "dense", "sparse"):
+                x = piqp_solve_qp(
+                    problem.P,
+                    problem.q,
+                    spa.csc_matrix(problem.G),
+                    problem.h,
+                    problem.A,
+                    problem.b,
+                    backend=backend,
+                )
+                self.assertIsNotNone(x)
+                self.assertTrue(np.allclose(x, x_ref, atol=1e-6))
+
+        def test_dense_conversion_warning(self):
+            """Warning issued when sparse matrices are converted to dense."""
+            problem = get_sd3310_problem()
+            with self.assertWarnsRegex(UserWarning, "Converted G to numpy"):
+                piqp_solve_qp(
+                    problem.P,
+                    problem.q,
+                    spa.csc_matrix(problem.G),
+                    problem.h,
+                    problem.A,
+                    problem.b,
+                    backend="dense",
+                )
+
         def test_invalid_backend(self):
             """Exception raised when asking for an invalid backend."""
             problem = get_sd3310_problem()
@@ -47,6 +47,16 @@ class TestProblem(unittest.TestCase):
         self.assertIsNone(lb)
         self.assertIsNone(ub)
 
+    def test_update(self):
+        problem = get_sd3310_problem()
+        G = problem.G
+        q = np.ones((problem.q.shape[0], 1))
+        problem.update(q=q, h=np.zeros(problem.h.shape))
+        self.assertEqual(problem.q.shape, (q.shape[0],))
+        self.assertTrue(np.allclose(problem.q, 1.0))
+        self.assertTrue(np.allclose(problem.h, 0.0))
+        self.assertIs(problem.G, G)
+
     def test_check_inequality_constraints(self):
         problem = get_sd3310_problem()
         P, q, G, h, A, b, _, _ = problem.unpack()